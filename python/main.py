@@ -1,13 +1,22 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 import os
+from contextlib import asynccontextmanager
 from functools import lru_cache
 from typing import Dict, Any
 import logging
 
 # Import route routers
 from python.routes import usps_router, geocode_router, kml_parser_router, house_api_router
+from python.routes.http_client import close_http_clients
+from python.routes.kml_parser import MAX_KML_BYTES, MAX_KML_REQUEST_BYTES
+from python.middleware import (
+    ResponseCacheMiddleware,
+    CompressionMiddleware,
+    RequestSizeLimitMiddleware,
+    OriginSetCORSMiddleware,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -15,14 +24,42 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: release pooled upstream connections on shutdown"""
+    yield
+    await close_http_clients()
+
+
 app = FastAPI(
     title="Kevin Althaus Python Service",
     docs_url="/docs" if os.getenv("PYTHON_ENV", "development") == "development" else None,
-    redoc_url="/redoc" if os.getenv("PYTHON_ENV", "development") == "development" else None
+    redoc_url="/redoc" if os.getenv("PYTHON_ENV", "development") == "development" else None,
+    # Serialize responses with orjson instead of the stdlib json encoder
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Performance middleware - compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Response cache for GET endpoints (total bytes per worker, TTL in seconds);
+# sized for the 512 MB production container
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+CACHE_TTL = 300
+
+# Performance middleware - response cache (innermost, so cached bodies are
+# stored uncompressed and CORS headers are still applied per request)
+app.add_middleware(ResponseCacheMiddleware, max_bytes=MAX_CACHE_BYTES, ttl=CACHE_TTL)
+
+# Performance middleware - compression (zstd when accepted, gzip otherwise)
+app.add_middleware(CompressionMiddleware, minimum_size=860, zstd_level=3)
+
+# Refuse oversized KML uploads from Content-Length, before form parsing
+# receives and spools the body (inside CORS so the 413 is readable)
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    max_body_size=MAX_KML_REQUEST_BYTES,
+    path_prefix="/kml",
+    detail=f"KML file too large. Maximum size is {MAX_KML_BYTES // (1024 * 1024)} MB.",
+)
 
 @lru_cache()
 def get_environment_config() -> Dict[str, Any]:
@@ -56,28 +93,34 @@ else:
         allowed_origins = ["http://localhost:3000", "http://localhost:3002", "http://localhost:3003"]
         allow_credentials = True
 
-# CORS middleware
+# CORS middleware (origins checked against a frozenset)
 app.add_middleware(
-    CORSMiddleware,
+    OriginSetCORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=allow_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Fixed bodies for /health and /, serialized once at import time. A new
+# Response is still built per request because middleware (CORS, compression)
+# mutates response headers in place.
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "python-service"})
+_ROOT_BODY = orjson.dumps({
+    "message": "Kevin Althaus Python Service",
+    "version": "1.0.0",
+    "environment": os.getenv("PYTHON_ENV", "development")
+})
+
 @app.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """Health check endpoint for Docker healthcheck"""
-    return {"status": "healthy", "service": "python-service"}
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers={"Cache-Control": "no-store"})
 
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Root endpoint"""
-    return {
-        "message": "Kevin Althaus Python Service",
-        "version": "1.0.0",
-        "environment": os.getenv("PYTHON_ENV", "development")
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 # Register routers
 app.include_router(usps_router)
@@ -89,4 +132,21 @@ if __name__ == "__main__":
     import uvicorn
     # Development only: binding to 0.0.0.0 exposes the service on all network interfaces
     # In production, use a proper ASGI server (e.g., Gunicorn with uvicorn workers) and configure host binding appropriately
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" select uvloop and httptools when installed (not available on Windows)
+    # Run one worker unless Redis is configured: without it the Nominatim rate
+    # limit and the response caches are per process. WEB_CONCURRENCY overrides.
+    workers = int(os.getenv("WEB_CONCURRENCY") or 0) or (
+        max(2, (os.cpu_count() or 2) // 2) if os.getenv("REDIS_URL") else 1
+    )
+    # Exported so worker processes know how many siblings share the limits
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "python.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=workers,
+        log_level="warning",
+        access_log=False
+    )
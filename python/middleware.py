@@ -0,0 +1,243 @@
+"""
+ASGI middleware for the Python service
+
+Implemented as pure ASGI callables (receive/send) rather than
+BaseHTTPMiddleware to keep per-request overhead low.
+"""
+
+from typing import Any, List, Sequence, Tuple
+from cachetools import TTLCache
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Optional zstd support (falls back to gzip when unavailable)
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - best-effort import
+    zstandard = None  # type: ignore
+
+# Responses larger than this are passed through without being cached
+MAX_CACHEABLE_BODY = 256 * 1024
+
+# Content types that are already compressed; recompressing them only costs CPU
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/zstd",
+    "text/event-stream",
+)
+
+# Cache-Control directives that opt a response out of caching
+_UNCACHEABLE_DIRECTIVES = (b"no-store", b"no-cache", b"private")
+
+
+def _entry_size(entry: Tuple[int, List[Tuple[bytes, bytes]], bytes]) -> int:
+    """Approximate memory held by a cache entry (body plus headers)"""
+    _, headers, body = entry
+    return len(body) + sum(len(name) + len(value) for name, value in headers)
+
+
+def _is_cacheable(headers: List[Tuple[bytes, bytes]]) -> bool:
+    """Check response headers for Cache-Control directives that forbid caching"""
+    for name, value in headers:
+        if name.lower() == b"cache-control":
+            value = value.lower()
+            if any(directive in value for directive in _UNCACHEABLE_DIRECTIVES):
+                return False
+    return True
+
+
+class ResponseCacheMiddleware:
+    """
+    Cache successful GET responses in a bounded TTL cache
+
+    Cache hits are answered before the request reaches routing. Only
+    200 responses are stored, and requests carrying credentials or
+    responses marked no-store/no-cache/private are never cached. The
+    cache is bounded by total size (max_bytes), not entry count, so
+    many distinct query strings can't grow it past the budget.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int = 16 * 1024 * 1024, ttl: float = 300) -> None:
+        self.app = app
+        self.cache: TTLCache = TTLCache(maxsize=max_bytes, ttl=ttl, getsizeof=_entry_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        for name, _ in scope["headers"]:
+            if name == b"authorization" or name == b"cookie":
+                await self.app(scope, receive, send)
+                return
+
+        key = (scope["path"], scope["query_string"])
+        cached = self.cache.get(key)
+        if cached is not None:
+            status, headers, body = cached
+            # Outer middleware may mutate headers in place, so send a copy
+            await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        status = 200
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        size = 0
+        cacheable = False
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal status, headers, size, cacheable
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                cacheable = status == 200 and _is_cacheable(headers)
+            elif message["type"] == "http.response.body" and cacheable:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > MAX_CACHEABLE_BODY:
+                    cacheable = False
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+                    if not message.get("more_body", False):
+                        entry = (status, headers, b"".join(chunks))
+                        # Never fail the response over a cache write
+                        if _entry_size(entry) <= self.cache.maxsize:
+                            self.cache[key] = entry
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
+
+
+class _SkipIncompressibleMixin:
+    """Pass already-compressed content types through without recompressing"""
+
+    content_type_is_excluded: bool
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await super().send_with_compression(message)  # type: ignore[misc]
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES):
+                self.content_type_is_excluded = True
+            return
+        await super().send_with_compression(message)  # type: ignore[misc]
+
+
+class _GZipResponder(_SkipIncompressibleMixin, GZipResponder):
+    pass
+
+
+class _IdentityResponder(_SkipIncompressibleMixin, IdentityResponder):
+    content_encoding = "identity"
+
+
+class _ZstdResponder(_SkipIncompressibleMixin, IdentityResponder):
+    content_encoding = "zstd"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int = 3) -> None:
+        super().__init__(app, minimum_size)
+        self.compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        data = self.compressobj.compress(body)
+        if more_body:
+            # Flush a complete block so streamed chunks are decodable as they arrive
+            return data + self.compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return data + self.compressobj.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with zstd or gzip based on Accept-Encoding
+
+    zstd is preferred when the client accepts it and the zstandard package
+    is installed; it compresses JSON at a similar ratio to gzip for a
+    fraction of the CPU. Bodies under minimum_size and already-compressed
+    content types are sent as-is.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 860,
+        gzip_level: int = 9,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+        responder: ASGIApp
+        if zstandard is not None and "zstd" in accept_encoding:
+            responder = _ZstdResponder(self.app, self.minimum_size, level=self.zstd_level)
+        elif "gzip" in accept_encoding:
+            responder = _GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = _IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Refuse requests whose Content-Length exceeds a limit
+
+    The check runs before the body is read, so an oversized upload is
+    answered with 413 instead of being received and spooled to disk by
+    form parsing. Requests without a Content-Length pass through;
+    endpoints still check the size of what they receive.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_size: int,
+        path_prefix: str = "/",
+        detail: str = "Request body too large.",
+    ) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+        self.path_prefix = path_prefix
+        self.detail = detail
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.path_prefix):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = JSONResponse({"detail": self.detail}, status_code=413)
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
+
+
+class OriginSetCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware with constant-time origin checks
+
+    Starlette stores allow_origins as given and scans it on every CORS
+    request; a frozenset makes the membership test O(1). Allowed methods
+    and headers are already pre-joined by CORSMiddleware at init.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs: Any) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins = frozenset(allow_origins)  # type: ignore[assignment]
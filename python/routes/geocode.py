@@ -6,19 +6,17 @@ Rate limit: 1 request per second
 """
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Optional, List, Dict, Any
 import httpx
+import orjson
 import asyncio
 import logging
-from datetime import datetime
 import os
+import time
 
-# Optional Redis-based rate limiting (distributed)
-try:
-    import redis.asyncio as aioredis  # type: ignore
-except Exception:  # pragma: no cover - best-effort import
-    aioredis = None  # type: ignore
+from .http_client import get_http_client
+from .redis_client import get_redis
 
 router = APIRouter(prefix="/geocode", tags=["Geocoding"])
 logger = logging.getLogger(__name__)
@@ -26,24 +24,33 @@ logger = logging.getLogger(__name__)
 # Rate limiting: Nominatim requires 1 request per second
 _last_request_time: Optional[float] = None
 _rate_limit_lock = asyncio.Lock()
-_redis = None
 
+# Distributed rate limiting: the key holds the epoch-ms of the next free
+# request slot. The script reserves a slot and returns how long the caller
+# must wait for it, in one atomic round trip.
+RATE_LIMIT_KEY = "rate:geocode:next_slot"
+RATE_LIMIT_INTERVAL_MS = 1000
 
-async def _get_redis():
-    global _redis
-    if _redis is not None:
-        return _redis
-    if aioredis is None:
-        return None
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    try:
-        _redis = aioredis.from_url(redis_url, decode_responses=True)
-        # Simple ping to verify connectivity
-        await _redis.ping()
-        return _redis
-    except Exception:
-        _redis = None
-        return None
+# Without Redis each worker process limits on its own, so the local fallback
+# spaces requests by the worker count to keep the combined rate at 1/second
+try:
+    _worker_count = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+except ValueError:
+    _worker_count = 1
+LOCAL_RATE_LIMIT_INTERVAL = RATE_LIMIT_INTERVAL_MS / 1000 * _worker_count
+RATE_LIMIT_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local slot = tonumber(redis.call('GET', KEYS[1]) or '0')
+if slot < now then slot = now end
+redis.call('SET', KEYS[1], slot + interval, 'PX', slot - now + interval)
+return slot - now
+"""
+_rate_limit_script = None
+
+# Nominatim requires a User-Agent header
+NOMINATIM_HEADERS = {"User-Agent": "SSddValidator/1.0 (contact@kevinalthaus.com)"}
 
 
 class GeocodeRequest(BaseModel):
@@ -53,6 +60,8 @@ class GeocodeRequest(BaseModel):
 
 class GeocodeResult(BaseModel):
     """Individual geocoding result"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     lat: float = Field(..., description="Latitude coordinate")
     lng: float = Field(..., description="Longitude coordinate")
     display_name: str = Field(..., description="Formatted display name from Nominatim")
@@ -64,46 +73,54 @@ class GeocodeResult(BaseModel):
 
 class GeocodeResponse(BaseModel):
     """Response model for geocoding"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     success: bool = Field(..., description="Whether geocoding was successful")
     results: List[GeocodeResult] = Field(default_factory=list, description="List of geocoding results")
     error: Optional[str] = Field(None, description="Error message if geocoding failed")
     query: str = Field(..., description="Original query address")
 
 
+# Validates all results from one Nominatim response in a single call
+_RESULT_LIST_ADAPTER = TypeAdapter(List[GeocodeResult])
+
+
 async def enforce_rate_limit() -> None:
     """
     Enforce Nominatim rate limit of 1 request per second
 
-    Uses a lock to ensure only one request is made at a time,
-    and adds delay if needed to maintain 1 req/sec limit.
+    With Redis available, each caller atomically reserves the next free
+    1-second slot in a single round trip and sleeps until it. Otherwise
+    a process-local lock spaces requests LOCAL_RATE_LIMIT_INTERVAL apart
+    (1 second per worker process).
     """
     # Allow tests to bypass rate limit
     if os.getenv("E2E_TESTING") == "true":
         return
 
     # Try Redis-based distributed limiter first
-    r = await _get_redis()
+    r = await get_redis()
     if r is not None:
-        # Use a simple distributed lock with 1s TTL
-        key = "rate:geocode:lock"
-        while True:
-            locked = await r.set(key, "1", ex=1, nx=True)
-            if locked:
-                return
-            # Wait for key to expire
-            ttl = await r.ttl(key)
-            wait_time = 1.0 if ttl is None or ttl < 0 else max(0.05, ttl)
-            logger.debug(f"Redis rate limit in effect; waiting {wait_time:.2f}s")
-            await asyncio.sleep(min(wait_time, 1.0))
+        try:
+            global _rate_limit_script
+            if _rate_limit_script is None:
+                _rate_limit_script = r.register_script(RATE_LIMIT_LUA)
+            wait_ms = int(await _rate_limit_script(keys=[RATE_LIMIT_KEY], args=[RATE_LIMIT_INTERVAL_MS]))
+            if wait_ms > 0:
+                logger.debug(f"Redis rate limit in effect; waiting {wait_ms / 1000:.2f}s")
+                await asyncio.sleep(wait_ms / 1000)
+            return
+        except Exception as e:
+            logger.debug(f"Redis rate limiter failed, using local limiter: {str(e)}")
 
     # Fallback to process-local limiter
     global _last_request_time
     async with _rate_limit_lock:
         if _last_request_time is not None:
-            elapsed = datetime.now().timestamp() - _last_request_time
-            if elapsed < 1.0:
-                await asyncio.sleep(1.0 - elapsed)
-        _last_request_time = datetime.now().timestamp()
+            elapsed = time.monotonic() - _last_request_time
+            if elapsed < LOCAL_RATE_LIMIT_INTERVAL:
+                await asyncio.sleep(LOCAL_RATE_LIMIT_INTERVAL - elapsed)
+        _last_request_time = time.monotonic()
 
 
 @router.post("", response_model=GeocodeResponse)
@@ -136,61 +153,55 @@ async def geocode_address(request: GeocodeRequest) -> GeocodeResponse:
             "limit": 5  # Return up to 5 results
         }
 
-        headers = {
-            # Nominatim requires a User-Agent header
-            "User-Agent": "SSddValidator/1.0 (contact@kevinalthaus.com)"
-        }
+        client = get_http_client("nominatim", timeout=10.0, headers=NOMINATIM_HEADERS)
+        response = await client.get(nominatim_url, params=params)
+        response.raise_for_status()
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(nominatim_url, params=params, headers=headers)
-            response.raise_for_status()
-
-            # Parse JSON response
-            data = response.json()
-
-            if not data or len(data) == 0:
-                logger.info(f"No results found for address: {request.address}")
-                return GeocodeResponse(
-                    success=False,
-                    results=[],
-                    error="No results found for the given address",
-                    query=request.address
-                )
-
-            # Parse results
-            results = []
-            for item in data:
-                lat_val = item.get("lat")
-                lon_val = item.get("lon")
-                if lat_val is None or lon_val is None:
-                    logger.debug("Skipping result without coordinates")
-                    continue
-                try:
-                    lat_f = float(lat_val)
-                    lon_f = float(lon_val)
-                except (TypeError, ValueError):
-                    logger.debug("Skipping result with invalid coordinate types")
-                    continue
-                result = GeocodeResult(
-                    lat=lat_f,
-                    lng=lon_f,
-                    display_name=item.get("display_name", ""),
-                    place_id=item.get("place_id"),
-                    osm_type=item.get("osm_type"),
-                    osm_id=str(item.get("osm_id")) if item.get("osm_id") else None,
-                    importance=float(item.get("importance")) if item.get("importance") else None
-                )
-                results.append(result)
-
-            logger.info(f"Successfully geocoded address: {request.address} ({len(results)} results)")
+        # Parse JSON response
+        data = orjson.loads(response.content)
 
+        if not data or len(data) == 0:
+            logger.info(f"No results found for address: {request.address}")
             return GeocodeResponse(
-                success=True,
-                results=results,
-                error=None,
+                success=False,
+                results=[],
+                error="No results found for the given address",
                 query=request.address
             )
 
+        # Parse results
+        results: List[Dict[str, Any]] = []
+        for item in data:
+            lat_val = item.get("lat")
+            lon_val = item.get("lon")
+            if lat_val is None or lon_val is None:
+                logger.debug("Skipping result without coordinates")
+                continue
+            try:
+                lat_f = float(lat_val)
+                lon_f = float(lon_val)
+            except (TypeError, ValueError):
+                logger.debug("Skipping result with invalid coordinate types")
+                continue
+            results.append({
+                "lat": lat_f,
+                "lng": lon_f,
+                "display_name": item.get("display_name", ""),
+                "place_id": item.get("place_id"),
+                "osm_type": item.get("osm_type"),
+                "osm_id": str(item.get("osm_id")) if item.get("osm_id") else None,
+                "importance": float(item.get("importance")) if item.get("importance") else None
+            })
+
+        logger.info(f"Successfully geocoded address: {request.address} ({len(results)} results)")
+
+        return GeocodeResponse(
+            success=True,
+            results=_RESULT_LIST_ADAPTER.validate_python(results),
+            error=None,
+            query=request.address
+        )
+
     except httpx.HTTPStatusError as e:
         logger.error(f"Nominatim API HTTP error: {e.response.status_code}")
         raise HTTPException(
@@ -6,18 +6,33 @@ May require CONGRESS_API_KEY environment variable.
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from typing import List, Optional, Dict, Any
+from async_lru import alru_cache
+from cachetools import TTLCache
 import httpx
+import orjson
 import os
 import logging
 
+from .http_client import get_http_client
+from .redis_client import get_redis
+
 router = APIRouter(prefix="/house", tags=["Congressional API"])
 logger = logging.getLogger(__name__)
 
+# Membership changes rarely, so serialized /members responses are cached for
+# an hour. Redis (when available) shares entries across workers; the
+# in-process TTLCache is the fallback.
+MEMBERS_CACHE_TTL = 3600
+_members_cache: TTLCache = TTLCache(maxsize=256, ttl=MEMBERS_CACHE_TTL)
+
 
 class CongressionalMember(BaseModel):
     """Model for a Congressional member"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     bioguide_id: str = Field(..., description="Bioguide ID")
     name: str = Field(..., description="Full name")
     first_name: Optional[str] = Field(None, description="First name")
@@ -32,21 +47,52 @@ class CongressionalMember(BaseModel):
 
 class HouseMembersResponse(BaseModel):
     """Response model for House members query"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
     success: bool = Field(..., description="Whether query was successful")
     members: List[CongressionalMember] = Field(default_factory=list, description="List of House members")
     total_count: int = Field(..., description="Total number of members returned")
     error: Optional[str] = Field(None, description="Error message if query failed")
 
 
-def parse_member_data(member_data: Dict[str, Any]) -> Optional[CongressionalMember]:
+# Validates a whole list of parsed members in one pydantic-core call
+_MEMBER_LIST_ADAPTER = TypeAdapter(List[CongressionalMember])
+
+
+# Exact Congress.gov partyName values; anything else falls back to substring matching
+PARTY_LOOKUP = {
+    "Democratic": "Democrat",
+    "Democrat": "Democrat",
+    "Republican": "Republican",
+    "Independent": "Independent",
+}
+
+MEMBER_URL_PREFIX = "https://www.congress.gov/member/"
+MEMBER_IMAGE_URL_PREFIX = "https://www.congress.gov/img/member/"
+
+
+def _term_start_year(term: Dict[str, Any]) -> int:
+    """Sort key for member terms: start year, treating missing values as 0"""
+    return int(term.get("startYear", 0) or 0)
+
+
+def parse_member_data(
+    member_data: Dict[str, Any],
+    state_filter: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     """
     Parse member data from Congress.gov API response
 
+    Members outside the House, or outside state_filter when given, are
+    rejected early. The result is a plain dict of CongressionalMember
+    fields; validation happens in bulk via _MEMBER_LIST_ADAPTER.
+
     Args:
         member_data: Raw member data dictionary
+        state_filter: Optional upper-cased two-letter state code to keep
 
     Returns:
-        CongressionalMember object or None if data is invalid
+        CongressionalMember field dict or None if data is invalid or filtered out
     """
     try:
         # Extract basic info
@@ -55,88 +101,194 @@ def parse_member_data(member_data: Dict[str, Any]) -> Optional[CongressionalMemb
             logger.warning("Member missing bioguideId, skipping")
             return None
 
-        # Extract name
-        name = member_data.get("name", "")
-
         # Extract state
         state = member_data.get("state", "")
         if not state:
             logger.warning(f"Member {bioguide_id} missing state, skipping")
             return None
 
-        # Extract district (may be None for Senators or at-large districts)
-        district = member_data.get("district")
-        if district is not None:
-            try:
-                district = int(district)
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid district value for {bioguide_id}: {district}")
-                district = None
+        # Apply state filter if specified
+        if state_filter and state.upper() != state_filter:
+            return None
 
-        # Extract party
-        party_name = member_data.get("partyName", "")
-        party = "Unknown"
-        if "Democrat" in party_name:
-            party = "Democrat"
-        elif "Republican" in party_name:
-            party = "Republican"
-        elif "Independent" in party_name:
-            party = "Independent"
-        elif party_name:
-            party = party_name
-
-        # Determine chamber - use terms array if available
+        # Determine chamber - use most recent term if available
         chamber = "Unknown"
         terms = member_data.get("terms", {})
         if isinstance(terms, dict):
             items = terms.get("item", [])
-            if items and isinstance(items, list) and len(items) > 0:
-                # Get most recent term by startYear (descending)
+            if items and isinstance(items, list):
                 try:
-                    sorted_items = sorted(items, key=lambda it: int(it.get('startYear', 0) or 0), reverse=True)
-                    latest_term = sorted_items[0]
+                    latest_term = max(items, key=_term_start_year)
                 except Exception:
                     latest_term = items[0]
                 chamber = latest_term.get("chamber", "Unknown")
 
-        # Build URL to member page
-        url = None
-        if bioguide_id:
-            url = f"https://www.congress.gov/member/{bioguide_id}"
-
-        # Image URL (Congress.gov API pattern)
-        image_url = None
-        if bioguide_id:
-            image_url = f"https://www.congress.gov/img/member/{bioguide_id.lower()}_200.jpg"
-
-        return CongressionalMember(
-            bioguide_id=bioguide_id,
-            name=name,
-            first_name=member_data.get("firstName"),
-            last_name=member_data.get("lastName"),
-            state=state,
-            district=district,
-            party=party,
-            chamber=chamber,
-            url=url,
-            image_url=image_url
-        )
+        # Filter to House members only
+        if chamber.lower() != "house":
+            return None
+
+        # Extract district (may be None for at-large districts)
+        district = member_data.get("district")
+        if district is not None:
+            try:
+                district = int(district)
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid district value for {bioguide_id}: {district}")
+                district = None
+
+        # Extract party
+        party_name = member_data.get("partyName", "")
+        party = PARTY_LOOKUP.get(party_name)
+        if party is None:
+            if "Democrat" in party_name:
+                party = "Democrat"
+            elif "Republican" in party_name:
+                party = "Republican"
+            elif "Independent" in party_name:
+                party = "Independent"
+            else:
+                party = party_name or "Unknown"
+
+        return {
+            "bioguide_id": bioguide_id,
+            "name": member_data.get("name", ""),
+            "first_name": member_data.get("firstName"),
+            "last_name": member_data.get("lastName"),
+            "state": state,
+            "district": district,
+            "party": party,
+            "chamber": chamber,
+            # Member page and portrait image (Congress.gov URL patterns)
+            "url": f"{MEMBER_URL_PREFIX}{bioguide_id}",
+            "image_url": f"{MEMBER_IMAGE_URL_PREFIX}{bioguide_id.lower()}_200.jpg"
+        }
 
     except Exception as e:
         logger.error(f"Error parsing member data: {str(e)}")
         return None
 
 
+def members_cache_key(state: Optional[str], current_only: bool) -> str:
+    """Build the response cache key for a /members query"""
+    return f"cache:house:members:{state.upper() if state else '*'}:{int(current_only)}"
+
+
+async def get_cached_members(key: str) -> Optional[str]:
+    """
+    Look up a serialized /members response
+
+    Args:
+        key: Cache key from members_cache_key
+
+    Returns:
+        Serialized HouseMembersResponse JSON, or None on a miss
+    """
+    body = _members_cache.get(key)
+    if body is not None:
+        return body
+
+    r = await get_redis()
+    if r is not None:
+        try:
+            body = await r.get(key)
+        except Exception as e:
+            logger.debug(f"Redis cache read failed: {str(e)}")
+            body = None
+        if body is not None:
+            _members_cache[key] = body
+    return body
+
+
+async def set_cached_members(key: str, body: str) -> None:
+    """
+    Store a serialized /members response
+
+    Args:
+        key: Cache key from members_cache_key
+        body: Serialized HouseMembersResponse JSON
+    """
+    _members_cache[key] = body
+
+    r = await get_redis()
+    if r is not None:
+        try:
+            await r.set(key, body, ex=MEMBERS_CACHE_TTL)
+        except Exception as e:
+            logger.debug(f"Redis cache write failed: {str(e)}")
+
+
+@alru_cache(maxsize=16, ttl=MEMBERS_CACHE_TTL)
+async def fetch_congress_members(current_only: bool, api_key: Optional[str]) -> Dict[str, Any]:
+    """
+    Fetch the raw member list from Congress.gov API v3
+
+    Memoized per (current_only, api_key) for MEMBERS_CACHE_TTL seconds.
+    Concurrent cache misses share a single in-flight upstream request;
+    failures are not cached.
+
+    Args:
+        current_only: Whether to only fetch current members
+        api_key: Optional Congress.gov API key
+
+    Returns:
+        Parsed Congress.gov response body
+
+    Raises:
+        HTTPException: If the Congress API requires an API key
+        httpx.HTTPError: If the upstream request fails
+    """
+    # Build API URL
+    base_url = "https://api.congress.gov/v3/member"
+
+    # Query parameters
+    params: Dict[str, Any] = {
+        "limit": 250,  # Get up to 250 members per request
+        "format": "json"
+    }
+
+    if current_only:
+        params["currentMember"] = "true"
+
+    # Add API key if available
+    if api_key:
+        params["api_key"] = api_key
+
+    # Make request
+    client = get_http_client("congress", timeout=15.0)
+    response = await client.get(base_url, params=params)
+
+    # Check if we need API key
+    if response.status_code == 403:
+        logger.error("Congress API returned 403 - API key may be required")
+        raise HTTPException(
+            status_code=500,
+            detail="Congress API requires authentication. Please set CONGRESS_API_KEY environment variable."
+        )
+
+    response.raise_for_status()
+
+    # Parse response
+    return orjson.loads(response.content)
+
+
 @router.get("/members", response_model=HouseMembersResponse)
 async def get_house_members(
-    state: Optional[str] = Query(None, description="Filter by two-letter state code"),
+    state: Optional[str] = Query(
+        None,
+        min_length=2,
+        max_length=2,
+        pattern="^[A-Za-z]{2}$",
+        description="Filter by two-letter state code"
+    ),
     current_only: bool = Query(True, description="Only return current members")
-) -> HouseMembersResponse:
+) -> Response:
     """
     Get list of US House of Representatives members
 
     Fetches data from Congress.gov API v3.
     Filters to House members only (excludes Senators).
+    Successful responses are cached for MEMBERS_CACHE_TTL seconds per
+    (state, current_only) combination.
 
     Args:
         state: Optional state filter (two-letter code)
@@ -148,77 +300,59 @@ async def get_house_members(
     Raises:
         HTTPException: If Congress API is unavailable
     """
-    try:
-        # Build API URL
-        base_url = "https://api.congress.gov/v3/member"
-
-        # Query parameters
-        params: Dict[str, Any] = {
-            "limit": 250,  # Get up to 250 members per request
-            "format": "json"
-        }
+    cache_key = members_cache_key(state, current_only)
+    cached = await get_cached_members(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-        if current_only:
-            params["currentMember"] = "true"
-
-        # Add API key if available
-        api_key = os.getenv("CONGRESS_API_KEY")
-        if api_key:
-            params["api_key"] = api_key
-
-        # Make request
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(base_url, params=params)
-
-            # Check if we need API key
-            if response.status_code == 403:
-                logger.error("Congress API returned 403 - API key may be required")
-                raise HTTPException(
-                    status_code=500,
-                    detail="Congress API requires authentication. Please set CONGRESS_API_KEY environment variable."
-                )
-
-            response.raise_for_status()
-
-            # Parse response
-            data = response.json()
-
-            # Extract members array
-            members_data = data.get("members", [])
-            if not members_data:
-                logger.warning("No members found in API response")
-                return HouseMembersResponse(
-                    success=True,
-                    members=[],
-                    total_count=0,
-                    error=None
-                )
-
-            # Parse members and filter to House only
-            members: List[CongressionalMember] = []
-            for member_data in members_data:
-                parsed = parse_member_data(member_data)
-                if parsed is None:
-                    continue
-
-                # Filter to House members only
-                if parsed.chamber.lower() != "house":
-                    continue
-
-                # Apply state filter if specified
-                if state and parsed.state.upper() != state.upper():
-                    continue
-
-                members.append(parsed)
-
-            logger.info(f"Successfully fetched {len(members)} House members")
-
-            return HouseMembersResponse(
+    try:
+        # Fetch (or reuse) the upstream member list
+        data = await fetch_congress_members(current_only, os.getenv("CONGRESS_API_KEY"))
+
+        # Extract members array
+        members_data = data.get("members", [])
+        if not members_data:
+            logger.warning("No members found in API response")
+            result = HouseMembersResponse(
                 success=True,
-                members=members,
-                total_count=len(members),
+                members=[],
+                total_count=0,
                 error=None
             )
+            body = result.model_dump_json()
+            await set_cached_members(cache_key, body)
+            return Response(content=body, media_type="application/json")
+
+        # Parse members, keeping House members in the requested state only
+        state_filter = state.upper() if state else None
+        member_dicts: List[Dict[str, Any]] = []
+        for member_data in members_data:
+            parsed = parse_member_data(member_data, state_filter)
+            if parsed is not None:
+                member_dicts.append(parsed)
+
+        try:
+            members = _MEMBER_LIST_ADAPTER.validate_python(member_dicts)
+        except ValidationError:
+            # Fall back to per-member validation so one bad record doesn't fail the batch
+            members = []
+            for member_dict in member_dicts:
+                try:
+                    members.append(CongressionalMember.model_validate(member_dict))
+                except ValidationError as e:
+                    logger.error(f"Error parsing member data for {member_dict['bioguide_id']}: {str(e)}")
+
+        logger.info(f"Successfully fetched {len(members)} House members")
+
+        result = HouseMembersResponse(
+            success=True,
+            members=members,
+            total_count=len(members),
+            error=None
+        )
+        body = result.model_dump_json()
+        await set_cached_members(cache_key, body)
+        return Response(content=body, media_type="application/json")
 
     except httpx.HTTPStatusError as e:
         logger.error(f"Congress API HTTP error: {e.response.status_code}")
@@ -0,0 +1,44 @@
+"""
+Shared outbound HTTP clients for route modules
+
+Each upstream API gets one long-lived httpx.AsyncClient so TCP/TLS
+connections are pooled and reused across requests instead of being
+re-established per call. Clients are closed on application shutdown.
+"""
+
+from typing import Dict, Any
+import httpx
+
+# Connection pool limits shared by all upstream clients
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_http_client(name: str, **client_options: Any) -> httpx.AsyncClient:
+    """
+    Get the pooled client for an upstream API, creating it on first use
+
+    Args:
+        name: Upstream identifier (one client is kept per name)
+        **client_options: httpx.AsyncClient options, applied when the
+            client is created
+
+    Returns:
+        Shared AsyncClient with HTTP/2 and keep-alive enabled
+    """
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client_options.setdefault("http2", True)
+        client_options.setdefault("limits", DEFAULT_LIMITS)
+        client = httpx.AsyncClient(**client_options)
+        _clients[name] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients (called on application shutdown)"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
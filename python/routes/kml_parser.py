@@ -5,24 +5,103 @@ Parses KML files to extract district boundaries and convert to GeoJSON format.
 Handles both Polygon and MultiPolygon geometries.
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, BinaryIO, Iterator, Tuple, Callable, TypeVar
 import defusedxml.ElementTree as ET
-from xml.etree.ElementTree import Element  # For type hints only
+from xml.etree.ElementTree import Element, TreeBuilder
+from xml.parsers.expat import errors as expat_errors
+from cachetools import LRUCache
+import hashlib
+import orjson
 import logging
+import os
+import re
+
+# Optional NumPy acceleration for coordinate parsing
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - best-effort import
+    np = None  # type: ignore
 
 router = APIRouter(prefix="/kml", tags=["KML Parser"])
 logger = logging.getLogger(__name__)
 
 # KML namespace
-KML_NS = {"kml": "http://www.opengis.net/kml/2.2"}
+KML_NAMESPACE = "http://www.opengis.net/kml/2.2"
+KML_NS = {"kml": KML_NAMESPACE}
+
+# Namespace-qualified ({ns}tag) names, resolved once at import time.
+# Single-tag lookups in this form run entirely in C ElementTree; prefixed
+# "kml:" paths with a namespaces map go through the Python ElementPath
+# engine on every call.
+PLACEMARK_TAG = f"{{{KML_NAMESPACE}}}Placemark"
+DOCUMENT_TAG = f"{{{KML_NAMESPACE}}}Document"
+NAME_TAG = f"{{{KML_NAMESPACE}}}name"
+DESCRIPTION_TAG = f"{{{KML_NAMESPACE}}}description"
+MULTI_GEOMETRY_TAG = f"{{{KML_NAMESPACE}}}MultiGeometry"
+POLYGON_TAG = f"{{{KML_NAMESPACE}}}Polygon"
+EXTENDED_DATA_TAG = f"{{{KML_NAMESPACE}}}ExtendedData"
+DATA_TAG = f"{{{KML_NAMESPACE}}}Data"
+VALUE_TAG = f"{{{KML_NAMESPACE}}}value"
+
+# Outer ring coordinates relative to a Polygon element
+OUTER_RING_PATH = (
+    f"{{{KML_NAMESPACE}}}outerBoundaryIs/"
+    f"{{{KML_NAMESPACE}}}LinearRing/"
+    f"{{{KML_NAMESPACE}}}coordinates"
+)
+
+# One whitespace-delimited lng,lat[,...] tuple; only lng and lat are
+# captured, and anything after the second comma is ignored
+_FLOAT = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_COORD_RE = re.compile(rf"(?<!\S)({_FLOAT}),({_FLOAT})(?:,\S*)?(?!\S)")
+
+# Deletes the characters of a float literal, leaving a tuple's separators
+_NUMBER_CHARS = str.maketrans("", "", "0123456789.+-eE")
+
+# Expat errors raised for bytes that aren't valid UTF-8; files that fail with
+# these are retried as latin-1 (KML without an encoding declaration)
+ENCODING_ERROR_CODES = frozenset((
+    expat_errors.codes[expat_errors.XML_ERROR_INVALID_TOKEN],
+    expat_errors.codes[expat_errors.XML_ERROR_PARTIAL_CHAR],
+))
+
+_T = TypeVar("_T")
+
+# Largest accepted KML upload. Requests to /kml whose Content-Length is
+# over MAX_KML_REQUEST_BYTES (the file plus room for multipart framing and
+# form fields) are refused by middleware before the body is read.
+MAX_KML_BYTES = 32 * 1024 * 1024
+MAX_KML_REQUEST_BYTES = MAX_KML_BYTES + 64 * 1024
+
+# Parsed response bodies are cached by upload content hash. Uploads and
+# bodies at or under KML_CACHE_MIN_BYTES are cheaper to re-parse than to
+# hash; the cache is bounded by total body size per worker process
+# (KML_CACHE_MAX_BYTES env var, default 16 MB; 0 disables caching).
+KML_CACHE_MIN_BYTES = 32 * 1024
+KML_CACHE_MAX_BYTES = int(os.getenv("KML_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# (content digest, details) -> serialized KMLParseResponse body
+_kml_cache: LRUCache = LRUCache(maxsize=KML_CACHE_MAX_BYTES, getsizeof=len)
 
 
 class GeometryCoordinates(BaseModel):
-    """Coordinates for a geometry"""
+    """
+    Coordinates for a geometry
+
+    Each ring is either a contiguous (n, 2) float64 NumPy array of
+    [lng, lat] rows or, without NumPy, a list of [lng, lat] pairs. Arrays
+    are written straight from their buffers by orjson when the response
+    is serialized, avoiding one Python list per vertex.
+
+    The parser builds geometries and features as plain dicts with this
+    shape; the models document the response schema.
+    """
     type: str = Field(..., description="Geometry type (Polygon or MultiPolygon)")
-    coordinates: Union[List[List[List[float]]], List[List[List[List[float]]]]] = Field(
+    coordinates: Any = Field(
         ...,
         description="GeoJSON coordinates array"
     )
@@ -43,13 +122,98 @@ class KMLParseResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="KML metadata (document name, etc.)")
 
 
-def parse_coordinates(coord_string: str) -> List[List[float]]:
+class KMLSummaryResponse(BaseModel):
+    """Response model for KML summaries (placemark names only)"""
+    success: bool = Field(..., description="Whether parsing was successful")
+    count: int = Field(0, description="Number of placemarks in the file")
+    names: List[Optional[str]] = Field(default_factory=list, description="Placemark names in document order")
+    error: Optional[str] = Field(None, description="Error message if parsing failed")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="KML metadata (document name, etc.)")
+
+
+def _parse_coordinates_numpy(coord_string: str) -> Optional[Any]:
     """
-    Parse KML coordinate string to list of [lng, lat] pairs
+    Vectorized coordinate parsing with NumPy
+
+    Args:
+        coord_string: Space-separated coordinate tuples
+
+    Returns:
+        Contiguous (n, 2) array of [longitude, latitude] rows, or None if the string isn't a
+        uniform run of lng,lat or lng,lat,alt tuples (the caller then falls
+        back to the per-tuple parser)
+    """
+    stripped = coord_string.strip()
+    if not stripped:
+        return None
+
+    # Tuple width (2 or 3 values) is taken from the first tuple
+    dims = stripped.split(None, 1)[0].count(",") + 1
+    if dims not in (2, 3):
+        return None
+
+    try:
+        values = np.fromstring(stripped.replace(",", " "), dtype=np.float64, sep=" ")
+    except ValueError:
+        return None
+
+    # Every tuple must have exactly dims fields; comparing totals alone lets
+    # mixed widths balance out. Stripping the number characters from the
+    # tuples leaves only their commas, which must be dims - 1 per tuple.
+    tuples = stripped.split()
+    if " ".join(tuples).translate(_NUMBER_CHARS) != " ".join(["," * (dims - 1)] * len(tuples)):
+        return None
+
+    # Each non-empty field parses to exactly one value (anything else raised
+    # above), so a short count means some field was empty
+    if values.size != len(tuples) * dims:
+        return None
+
+    # orjson only serializes C-contiguous arrays, so copy out the lng/lat columns
+    return np.ascontiguousarray(values.reshape(-1, dims)[:, :2])
+
+
+def parse_coordinates(coord_string: str) -> Any:
+    """
+    Parse KML coordinate string to [lng, lat] pairs
 
     KML format: "lng,lat,alt lng,lat,alt ..."
     GeoJSON format: [[lng, lat], [lng, lat], ...]
 
+    Args:
+        coord_string: Space-separated coordinate triplets
+
+    Returns:
+        (n, 2) NumPy array of [longitude, latitude] rows when NumPy is
+        available, otherwise a list of [longitude, latitude] pairs
+
+    Raises:
+        ValueError: If coordinates are invalid
+    """
+    if np is not None:
+        fast_coordinates = _parse_coordinates_numpy(coord_string)
+        if fast_coordinates is not None:
+            return fast_coordinates
+
+    # Single regex pass over the string for the common well-formed case
+    coordinates = [
+        [float(lng), float(lat)]
+        for lng, lat in _COORD_RE.findall(coord_string)
+    ]
+    if coordinates and len(coordinates) == len(coord_string.split()):
+        return coordinates
+
+    # Some tuple didn't match; the per-tuple parser warns about or rejects it
+    return _parse_coordinates_split(coord_string)
+
+
+def _parse_coordinates_split(coord_string: str) -> List[List[float]]:
+    """
+    Per-tuple coordinate parsing
+
+    Tuples with fewer than two values are skipped with a warning; a tuple
+    whose lng or lat isn't a number rejects the whole string.
+
     Args:
         coord_string: Space-separated coordinate triplets
 
@@ -61,10 +225,7 @@ def parse_coordinates(coord_string: str) -> List[List[float]]:
     """
     try:
         coordinates = []
-        # Split by whitespace and filter empty strings
-        coord_triplets = [c.strip() for c in coord_string.strip().split() if c.strip()]
-
-        for triplet in coord_triplets:
+        for triplet in coord_string.split():
             parts = triplet.split(',')
             if len(parts) < 2:
                 logger.warning(f"Invalid coordinate triplet: {triplet}")
@@ -85,52 +246,122 @@ def parse_coordinates(coord_string: str) -> List[List[float]]:
         raise ValueError(f"Invalid coordinate format: {str(e)}")
 
 
-def parse_polygon(placemark: Element) -> Optional[GeometryCoordinates]:
+def parse_outer_ring(polygon: Element) -> Optional[Any]:
+    """
+    Parse the outer ring coordinates of a KML Polygon element
+
+    Args:
+        polygon: KML Polygon element
+
+    Returns:
+        Ring coordinates (see parse_coordinates), or None if the polygon
+        has no outer ring coordinates
+
+    Raises:
+        ValueError: If the coordinates are invalid
+    """
+    outer_boundary = polygon.find(OUTER_RING_PATH)
+    if outer_boundary is None or not outer_boundary.text:
+        return None
+    return parse_coordinates(outer_boundary.text)
+
+
+def parse_multi_geometry(multi_geometry: Element) -> Optional[Dict[str, Any]]:
+    """
+    Parse a KML MultiGeometry element as a GeoJSON MultiPolygon
+
+    Args:
+        multi_geometry: KML MultiGeometry element
+
+    Returns:
+        MultiPolygon geometry dict, or None if it has no valid polygons
+    """
+    # MultiPolygon: array of polygons
+    polygons = []
+    for polygon_elem in multi_geometry.iterfind(POLYGON_TAG):
+        try:
+            coords = parse_outer_ring(polygon_elem)
+        except ValueError as e:
+            logger.warning(f"Skipping invalid polygon: {str(e)}")
+            continue
+        if coords is not None:
+            # GeoJSON Polygon: [[[outer ring]]]
+            polygons.append([coords])
+
+    if polygons:
+        return {"type": "MultiPolygon", "coordinates": polygons}
+    return None
+
+
+def parse_single_polygon(polygon: Element) -> Optional[Dict[str, Any]]:
+    """
+    Parse a KML Polygon element as a GeoJSON Polygon
+
+    Args:
+        polygon: KML Polygon element
+
+    Returns:
+        Polygon geometry dict, or None if it has no valid outer ring
+    """
+    try:
+        coords = parse_outer_ring(polygon)
+    except ValueError as e:
+        logger.warning(f"Invalid polygon coordinates: {str(e)}")
+        return None
+    if coords is None:
+        return None
+    # GeoJSON Polygon: [[[outer ring]]]
+    return {"type": "Polygon", "coordinates": [coords]}
+
+
+def has_outer_ring(polygon: Element) -> bool:
+    """Check whether a KML Polygon element has outer ring coordinates"""
+    outer_boundary = polygon.find(OUTER_RING_PATH)
+    return outer_boundary is not None and bool(outer_boundary.text)
+
+
+def parse_polygon(placemark: Element, details: bool = True) -> Optional[Dict[str, Any]]:
     """
     Parse a Polygon or MultiPolygon from KML placemark
 
     Args:
         placemark: KML Placemark element
+        details: Parse ring coordinates; when False only the geometry type
+            is determined and coordinates is an empty list
 
     Returns:
-        GeometryCoordinates object or None if no valid geometry found
+        GeoJSON geometry dict (GeometryCoordinates shape) or None if no
+        valid geometry found
     """
-    # Check for MultiGeometry (MultiPolygon)
-    multi_geometry = placemark.find(".//kml:MultiGeometry", KML_NS)
+    # Find both geometry kinds in one pass over the placemark's children
+    multi_geometry = polygon = None
+    for child in placemark:
+        tag = child.tag
+        if tag == MULTI_GEOMETRY_TAG:
+            if multi_geometry is None:
+                multi_geometry = child
+        elif tag == POLYGON_TAG:
+            if polygon is None:
+                polygon = child
+
+    if not details:
+        # Type only: no coordinate strings are parsed
+        if multi_geometry is not None and any(
+            has_outer_ring(polygon_elem) for polygon_elem in multi_geometry.iterfind(POLYGON_TAG)
+        ):
+            return {"type": "MultiPolygon", "coordinates": []}
+        if polygon is not None and has_outer_ring(polygon):
+            return {"type": "Polygon", "coordinates": []}
+        return None
+
+    # MultiGeometry (MultiPolygon) takes precedence over a single Polygon
     if multi_geometry is not None:
-        # MultiPolygon: array of polygons
-        polygons = []
-        for polygon_elem in multi_geometry.findall(".//kml:Polygon", KML_NS):
-            outer_boundary = polygon_elem.find(".//kml:outerBoundaryIs//kml:coordinates", KML_NS)
-            if outer_boundary is not None and outer_boundary.text:
-                try:
-                    coords = parse_coordinates(outer_boundary.text)
-                    # GeoJSON Polygon: [[[outer ring]]]
-                    polygons.append([coords])
-                except ValueError as e:
-                    logger.warning(f"Skipping invalid polygon: {str(e)}")
-                    continue
-
-        if polygons:
-            return GeometryCoordinates(
-                type="MultiPolygon",
-                coordinates=polygons
-            )
+        geometry = parse_multi_geometry(multi_geometry)
+        if geometry is not None:
+            return geometry
 
-    # Check for single Polygon
-    polygon = placemark.find(".//kml:Polygon", KML_NS)
     if polygon is not None:
-        outer_boundary = polygon.find(".//kml:outerBoundaryIs//kml:coordinates", KML_NS)
-        if outer_boundary is not None and outer_boundary.text:
-            try:
-                coords = parse_coordinates(outer_boundary.text)
-                # GeoJSON Polygon: [[[outer ring]]]
-                return GeometryCoordinates(
-                    type="Polygon",
-                    coordinates=[coords]
-                )
-            except ValueError as e:
-                logger.warning(f"Invalid polygon coordinates: {str(e)}")
+        return parse_single_polygon(polygon)
 
     return None
 
@@ -147,38 +378,258 @@ def extract_properties(placemark: Element) -> Dict[str, Any]:
     """
     properties: Dict[str, Any] = {}
 
+    # One pass over the children instead of a find() per field; the first
+    # element of each kind wins, as with find(). Tags are compared with ==
+    # because parsed tag strings are not the same objects as the constants.
+    name_elem = desc_elem = extended_data = None
+    for child in placemark:
+        tag = child.tag
+        if tag == NAME_TAG:
+            if name_elem is None:
+                name_elem = child
+        elif tag == DESCRIPTION_TAG:
+            if desc_elem is None:
+                desc_elem = child
+        elif tag == EXTENDED_DATA_TAG:
+            if extended_data is None:
+                extended_data = child
+
     # Extract name
-    name_elem = placemark.find("kml:name", KML_NS)
     if name_elem is not None and name_elem.text:
         properties["name"] = name_elem.text.strip()
 
     # Extract description
-    desc_elem = placemark.find("kml:description", KML_NS)
     if desc_elem is not None and desc_elem.text:
         properties["description"] = desc_elem.text.strip()
 
     # Extract ExtendedData
-    extended_data = placemark.find("kml:ExtendedData", KML_NS)
     if extended_data is not None:
-        for data_elem in extended_data.findall("kml:Data", KML_NS):
+        for data_elem in extended_data:
+            if data_elem.tag != DATA_TAG:
+                continue
             name_attr = data_elem.get("name")
-            value_elem = data_elem.find("kml:value", KML_NS)
+            value_elem = data_elem.find(VALUE_TAG)
             if name_attr and value_elem is not None and value_elem.text:
                 properties[name_attr] = value_elem.text.strip()
 
     return properties
 
 
+def iter_placemarks(
+    source: BinaryIO,
+    metadata: Dict[str, Any],
+    encoding: Optional[str] = None
+) -> Iterator[Element]:
+    """
+    Stream Placemark elements from a KML document
+
+    Each placemark is yielded once its end tag is parsed, then cleared and
+    detached from its parent so memory stays bounded by the current
+    placemark rather than the whole document.
+
+    Args:
+        source: Binary file object containing KML
+        metadata: Dictionary that receives document name/description
+        encoding: Encoding that overrides the document's own declaration
+
+    Yields:
+        Fully parsed KML Placemark elements
+
+    Raises:
+        ET.ParseError: If the document is not well-formed XML
+    """
+    # Open elements from the root down to the current position
+    stack: List[Element] = []
+
+    parser = None
+    if encoding is not None:
+        parser = ET.DefusedXMLParser(target=TreeBuilder(), encoding=encoding)
+
+    for event, elem in ET.iterparse(source, events=("start", "end"), parser=parser):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        tag = elem.tag
+
+        if tag == PLACEMARK_TAG:
+            yield elem
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+        elif stack and stack[-1].tag == DOCUMENT_TAG and elem.text:
+            # Document metadata (first Document wins)
+            if tag == NAME_TAG:
+                metadata.setdefault("document_name", elem.text.strip())
+            elif tag == DESCRIPTION_TAG:
+                metadata.setdefault("document_description", elem.text.strip())
+
+
+def parse_kml_features(
+    source: BinaryIO,
+    details: bool = True,
+    encoding: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+    """
+    Parse district features from a KML document
+
+    Synchronous and CPU-bound; the endpoint runs it in a worker thread.
+
+    Args:
+        source: Binary file object containing KML
+        details: Parse ring coordinates (see parse_polygon)
+        encoding: Encoding override (see iter_placemarks)
+
+    Returns:
+        Tuple of (features as DistrictFeature-shaped dicts, document
+        metadata, number of placemarks seen)
+
+    Raises:
+        ET.ParseError: If the document is not well-formed XML
+    """
+    metadata: Dict[str, Any] = {}
+    features: List[Dict[str, Any]] = []
+    placemark_count = 0
+
+    # Stream placemarks from the file
+    for placemark in iter_placemarks(source, metadata, encoding):
+        placemark_count += 1
+
+        # Extract geometry
+        geometry = parse_polygon(placemark, details)
+        if geometry is None:
+            logger.warning("Placemark has no valid geometry, skipping")
+            continue
+
+        # Extract properties
+        properties = extract_properties(placemark)
+
+        # Create feature (DistrictFeature shape)
+        features.append({
+            "type": "Feature",
+            "properties": properties,
+            "geometry": geometry
+        })
+
+    return features, metadata, placemark_count
+
+
+def summarize_kml(
+    source: BinaryIO,
+    encoding: Optional[str] = None
+) -> Tuple[List[Optional[str]], Dict[str, Any]]:
+    """
+    Read placemark names from a KML document without parsing geometry
+
+    Args:
+        source: Binary file object containing KML
+        encoding: Encoding override (see iter_placemarks)
+
+    Returns:
+        Tuple of (placemark names in document order, document metadata)
+
+    Raises:
+        ET.ParseError: If the document is not well-formed XML
+    """
+    metadata: Dict[str, Any] = {}
+    names: List[Optional[str]] = []
+    for placemark in iter_placemarks(source, metadata, encoding):
+        name_elem = placemark.find(NAME_TAG)
+        names.append(name_elem.text.strip() if name_elem is not None and name_elem.text else None)
+    return names, metadata
+
+
+def parse_with_latin1_fallback(parse: Callable[..., _T], source: BinaryIO, *args: Any) -> _T:
+    """
+    Run a KML parse, retrying as latin-1 if the file isn't valid UTF-8
+
+    Args:
+        parse: parse_kml_features or summarize_kml
+        source: Seekable binary file object containing KML
+        *args: Extra arguments for parse
+
+    Returns:
+        Result of parse
+
+    Raises:
+        ET.ParseError: If the document is not well-formed XML
+    """
+    try:
+        return parse(source, *args)
+    except ET.ParseError as e:
+        if e.code not in ENCODING_ERROR_CODES:
+            raise
+        logger.info(f"KML is not valid UTF-8 ({str(e)}), retrying as latin-1")
+        source.seek(0)
+        try:
+            return parse(source, *args, encoding="latin-1")
+        except ET.ParseError:
+            raise e
+
+
+def kml_digest(source: BinaryIO) -> str:
+    """
+    Hash a KML upload for the response cache
+
+    Reads the file in chunks and rewinds it afterwards so it can still
+    be parsed.
+
+    Args:
+        source: Binary file object containing KML
+
+    Returns:
+        Hex BLAKE2b digest of the file contents
+    """
+    digest = hashlib.file_digest(source, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    source.seek(0)
+    return digest
+
+
+def kml_too_large() -> HTTPException:
+    """Build the 413 error for uploads over MAX_KML_BYTES"""
+    return HTTPException(
+        status_code=413,
+        detail=f"KML file too large. Maximum size is {MAX_KML_BYTES // (1024 * 1024)} MB."
+    )
+
+
+def check_kml_upload(file: UploadFile) -> None:
+    """
+    Reject uploads that aren't KML files or are too large
+
+    Raises:
+        HTTPException: If the file name doesn't end in .kml (400) or the
+            upload is larger than MAX_KML_BYTES (413)
+    """
+    if not file.filename or not file.filename.lower().endswith('.kml'):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload a KML file."
+        )
+    # Declared sizes are refused up front by RequestSizeLimitMiddleware;
+    # this catches uploads sent without a Content-Length
+    if file.size is not None and file.size > MAX_KML_BYTES:
+        raise kml_too_large()
+
+
 @router.post("/parse", response_model=KMLParseResponse)
-async def parse_kml(file: UploadFile = File(...)) -> KMLParseResponse:
+async def parse_kml(
+    file: UploadFile = File(...),
+    details: bool = Query(True, description="Include geometry coordinates (false returns geometry types only)")
+) -> Union[KMLParseResponse, Response]:
     """
     Parse KML file to extract district boundaries
 
     Converts KML format to GeoJSON features with properties.
-    Handles both Polygon and MultiPolygon geometries.
+    Handles both Polygon and MultiPolygon geometries. Placemarks are
+    streamed from the upload with iterparse rather than building the
+    whole document tree, and parsing runs in a worker thread.
 
     Args:
         file: Uploaded KML file
+        details: Include geometry coordinates; when false, each geometry
+            has its type and an empty coordinates list
 
     Returns:
         KMLParseResponse with list of district features
@@ -187,26 +638,23 @@ async def parse_kml(file: UploadFile = File(...)) -> KMLParseResponse:
         HTTPException: If file is invalid or parsing fails
     """
     # Validate file type
-    if not file.filename or not file.filename.lower().endswith('.kml'):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid file type. Please upload a KML file."
-        )
+    check_kml_upload(file)
 
     try:
-        # Read file content
-        content = await file.read()
-
-        # Decode to string (KML is XML text)
-        try:
-            kml_string = content.decode('utf-8')
-        except UnicodeDecodeError:
-            # Try latin-1 as fallback
-            kml_string = content.decode('latin-1')
-
-        # Parse XML
+        # Re-uploads of a large file are answered from the response cache
+        cache_key = None
+        if KML_CACHE_MAX_BYTES > 0 and (file.size is None or file.size > KML_CACHE_MIN_BYTES):
+            cache_key = (await run_in_threadpool(kml_digest, file.file), details)
+            cached = _kml_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Serving cached KML parse result: {file.filename}")
+                return Response(content=cached, media_type="application/json")
+
+        # Parse in a worker thread so large uploads don't block the event loop
         try:
-            root = ET.fromstring(kml_string)
+            features, metadata, placemark_count = await run_in_threadpool(
+                parse_with_latin1_fallback, parse_kml_features, file.file, details
+            )
         except ET.ParseError as e:
             logger.error(f"XML parse error: {str(e)}")
             raise HTTPException(
@@ -214,52 +662,19 @@ async def parse_kml(file: UploadFile = File(...)) -> KMLParseResponse:
                 detail=f"Invalid KML file: {str(e)}"
             )
 
-        # Extract document metadata
-        metadata = {}
-        document = root.find(".//kml:Document", KML_NS)
-        if document is not None:
-            doc_name = document.find("kml:name", KML_NS)
-            if doc_name is not None and doc_name.text:
-                metadata["document_name"] = doc_name.text.strip()
-
-            doc_desc = document.find("kml:description", KML_NS)
-            if doc_desc is not None and doc_desc.text:
-                metadata["document_description"] = doc_desc.text.strip()
-
-        # Extract all placemarks
-        features: List[DistrictFeature] = []
-        placemarks = root.findall(".//kml:Placemark", KML_NS)
-
-        if not placemarks:
+        # Error envelopes hold only values produced in this module, so
+        # model_construct skips re-validating them
+        if placemark_count == 0:
             logger.warning("No placemarks found in KML file")
-            return KMLParseResponse(
+            return KMLParseResponse.model_construct(
                 success=False,
                 features=[],
                 error="No placemarks found in KML file",
                 metadata=metadata if metadata else None
             )
 
-        # Parse each placemark
-        for placemark in placemarks:
-            # Extract geometry
-            geometry = parse_polygon(placemark)
-            if geometry is None:
-                logger.warning("Placemark has no valid geometry, skipping")
-                continue
-
-            # Extract properties
-            properties = extract_properties(placemark)
-
-            # Create feature
-            feature = DistrictFeature(
-                type="Feature",
-                properties=properties,
-                geometry=geometry
-            )
-            features.append(feature)
-
         if not features:
-            return KMLParseResponse(
+            return KMLParseResponse.model_construct(
                 success=False,
                 features=[],
                 error="No valid district boundaries found in KML file",
@@ -268,12 +683,23 @@ async def parse_kml(file: UploadFile = File(...)) -> KMLParseResponse:
 
         logger.info(f"Successfully parsed KML file: {file.filename} ({len(features)} features)")
 
-        return KMLParseResponse(
-            success=True,
-            features=features,
-            error=None,
-            metadata=metadata if metadata else None
+        # Serialize the KMLParseResponse body directly; features were built
+        # in-module, so per-feature model validation is skipped. orjson
+        # writes coordinate arrays straight from their NumPy buffers.
+        body = {
+            "success": True,
+            "features": features,
+            "error": None,
+            "metadata": metadata if metadata else None
+        }
+        content = await run_in_threadpool(
+            orjson.dumps, body, option=orjson.OPT_SERIALIZE_NUMPY
         )
+        # Bodies can be more than twice the upload size, so skip any that
+        # wouldn't fit the cache's byte budget (LRUCache raises ValueError)
+        if cache_key is not None and KML_CACHE_MIN_BYTES < len(content) <= _kml_cache.maxsize:
+            _kml_cache[cache_key] = content
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -285,3 +711,66 @@ async def parse_kml(file: UploadFile = File(...)) -> KMLParseResponse:
             status_code=500,
             detail=f"An unexpected error occurred while parsing KML file: {str(e)}"
         )
+
+
+@router.post("/summary", response_model=KMLSummaryResponse)
+async def summarize_kml_file(file: UploadFile = File(...)) -> Union[KMLSummaryResponse, Response]:
+    """
+    List the placemarks in a KML file without parsing their geometry
+
+    Args:
+        file: Uploaded KML file
+
+    Returns:
+        KMLSummaryResponse with placemark count and names
+
+    Raises:
+        HTTPException: If file is invalid or parsing fails
+    """
+    check_kml_upload(file)
+
+    try:
+        try:
+            names, metadata = await run_in_threadpool(
+                parse_with_latin1_fallback, summarize_kml, file.file
+            )
+        except ET.ParseError as e:
+            logger.error(f"XML parse error: {str(e)}")
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid KML file: {str(e)}"
+            )
+
+        if not names:
+            logger.warning("No placemarks found in KML file")
+            return KMLSummaryResponse.model_construct(
+                success=False,
+                count=0,
+                names=[],
+                error="No placemarks found in KML file",
+                metadata=metadata if metadata else None
+            )
+
+        logger.info(f"Summarized KML file: {file.filename} ({len(names)} placemarks)")
+
+        # Serialize the KMLSummaryResponse body directly, as parse_kml does,
+        # so long name lists aren't revalidated against the response model
+        body = {
+            "success": True,
+            "count": len(names),
+            "names": names,
+            "error": None,
+            "metadata": metadata if metadata else None
+        }
+        return Response(content=orjson.dumps(body), media_type="application/json")
+
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+
+    except Exception as e:
+        logger.error(f"Unexpected error summarizing KML: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred while parsing KML file: {str(e)}"
+        )
@@ -0,0 +1,73 @@
+"""
+Shared Redis connection for route modules
+
+Redis is optional: when the client library is missing or the server is
+unreachable, callers receive None and fall back to process-local behavior.
+"""
+
+from typing import Optional, Any
+import logging
+import os
+import time
+
+# Optional Redis support (distributed rate limiting / caching)
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover - best-effort import
+    aioredis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying after a failed connection attempt, so an
+# unavailable Redis doesn't cost a connect attempt on every request
+RETRY_INTERVAL = 30.0
+
+# Seconds to wait on connect and on each command; Redis is on the local
+# network, so a slow server should fall back instead of stalling requests
+SOCKET_CONNECT_TIMEOUT = 0.5
+SOCKET_TIMEOUT = 0.5
+
+_redis: Optional[Any] = None
+_next_attempt: float = 0.0
+
+
+async def get_redis() -> Optional[Any]:
+    """
+    Get a connected Redis client
+
+    Returns:
+        Redis client, or None if Redis is unavailable
+    """
+    global _redis, _next_attempt
+    if _redis is not None:
+        return _redis
+    if aioredis is None:
+        return None
+
+    now = time.monotonic()
+    if now < _next_attempt:
+        return None
+
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    client = None
+    try:
+        client = aioredis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_connect_timeout=SOCKET_CONNECT_TIMEOUT,
+            socket_timeout=SOCKET_TIMEOUT,
+        )
+        # Simple ping to verify connectivity
+        await client.ping()
+        _redis = client
+        return _redis
+    except Exception as e:
+        logger.debug(f"Redis unavailable at {redis_url}: {str(e)}")
+        _next_attempt = now + RETRY_INTERVAL
+        if client is not None:
+            # Release the connection pool so retries don't leak clients
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+        return None
@@ -6,17 +6,85 @@ Requires USPS_API_USER_ID environment variable.
 """
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from cachetools import TTLCache
+from xml.etree.ElementTree import Element
+import asyncio
 import os
+import re
 import defusedxml.ElementTree as ET
-from xml.sax.saxutils import escape as xml_escape
 import httpx
 import logging
 
+from .http_client import get_http_client
+
 router = APIRouter(prefix="/usps", tags=["USPS"])
 logger = logging.getLogger(__name__)
 
+USPS_API_URL = "https://secure.shippingapis.com/ShippingAPI.dll"
+USPS_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+USPS_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+# Responses larger than this are rejected; a 5-address response is a few KB
+USPS_MAX_RESPONSE_BYTES = 64 * 1024
+
+# Request XML longer than this is POSTed instead of sent in the query string
+USPS_MAX_GET_XML = 1024
+
+# Maximum number of <Address> elements USPS accepts in one request
+USPS_MAX_BATCH = 5
+
+# Seconds concurrent /validate calls wait to be coalesced into one request
+USPS_BATCH_WINDOW = 0.02
+
+# Standardized addresses are cached for a day so repeat lookups skip USPS
+ADDRESS_CACHE_SIZE = 10_000
+ADDRESS_CACHE_TTL = 24 * 3600
+
+# AddressValidateRequest body; USPS doesn't need whitespace between elements
+USPS_REQUEST_TEMPLATE = (
+    '<AddressValidateRequest USERID="%(user_id)s">'
+    '<Revision>1</Revision>'
+    '%(addresses)s'
+    '</AddressValidateRequest>'
+)
+
+# One <Address> element of a request.
+# Note USPS Address1 is the secondary line and Address2 the primary line.
+USPS_ADDRESS_TEMPLATE = (
+    '<Address ID="%(id)d">'
+    '<Address1>%(street2)s</Address1>'
+    '<Address2>%(street1)s</Address2>'
+    '<City>%(city)s</City>'
+    '<State>%(state)s</State>'
+    '<Zip5>%(zip5)s</Zip5>'
+    '<Zip4>%(zip4)s</Zip4>'
+    '</Address>'
+)
+
+# Accepted ZIP formats: 12345, 123456789 or 12345-6789
+ZIP_PATTERN = re.compile(r"\d{5}(?:-?\d{4})?")
+
+# Escapes the XML-reserved characters in one str.translate pass
+_XML_ESC = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+})
+
+# Address fields read from a USPS response, with their standardized key names
+USPS_ADDRESS_FIELDS = (
+    ("Address1", "address1"),
+    ("Address2", "address2"),
+    ("City", "city"),
+    ("State", "state"),
+    ("Zip5", "zip5"),
+    ("Zip4", "zip4"),
+)
+
 
 class AddressRequest(BaseModel):
     """Request model for address validation"""
@@ -26,6 +94,45 @@ class AddressRequest(BaseModel):
     state: str = Field(..., min_length=2, max_length=2, description="Two-letter state code")
     zip: str = Field(..., description="ZIP code (5 or 9 digits)")
 
+    _zip5: str = PrivateAttr("")
+    _zip4: str = PrivateAttr("")
+
+    @field_validator("zip")
+    @classmethod
+    def validate_zip(cls, value: str) -> str:
+        """Reject ZIP codes that aren't 5 digits or ZIP+4"""
+        value = value.strip()
+        if not ZIP_PATTERN.fullmatch(value):
+            raise ValueError("ZIP code must be 5 digits or ZIP+4 (12345-6789)")
+        return value
+
+    @model_validator(mode="after")
+    def split_zip(self) -> "AddressRequest":
+        """Split the validated ZIP into its 5-digit and +4 parts once"""
+        self._zip5 = self.zip[:5]
+        self._zip4 = self.zip[-4:] if len(self.zip) > 5 else ""
+        return self
+
+    @property
+    def zip5(self) -> str:
+        """5-digit ZIP code"""
+        return self._zip5
+
+    @property
+    def zip4(self) -> str:
+        """ZIP+4 add-on digits, or an empty string"""
+        return self._zip4
+
+
+class AddressBatchRequest(BaseModel):
+    """Request model for batch address validation"""
+    addresses: List[AddressRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=USPS_MAX_BATCH,
+        description=f"Addresses to validate (at most {USPS_MAX_BATCH})"
+    )
+
 
 class AddressValidationResponse(BaseModel):
     """Response model for address validation"""
@@ -35,43 +142,57 @@ class AddressValidationResponse(BaseModel):
     raw_response: Optional[dict] = Field(None, description="Raw USPS response for debugging")
 
 
-def build_usps_xml(address: AddressRequest, user_id: str) -> str:
+class AddressBatchValidationResponse(BaseModel):
+    """Response model for batch address validation"""
+    results: List[AddressValidationResponse] = Field(..., description="Results in request order")
+
+
+def xml_escape(value: str) -> str:
+    """Escape a value for use in XML text or a quoted attribute"""
+    return value.translate(_XML_ESC)
+
+
+def build_usps_xml(addresses: Sequence[AddressRequest], user_id: str) -> str:
     """
     Build USPS API XML request with proper escaping to prevent XML injection
 
     Args:
-        address: Address to validate
+        addresses: Addresses to validate (at most USPS_MAX_BATCH); each is
+            sent with its index as the Address ID
         user_id: USPS API user ID
 
     Returns:
         XML string for USPS API request
     """
     # Escape all user inputs to prevent XML injection attacks
-    street1_escaped = xml_escape(address.street1)
-    street2_escaped = xml_escape(address.street2 or "")
-    city_escaped = xml_escape(address.city)
-    state_escaped = xml_escape(address.state.upper())
-    zip5_escaped = xml_escape(address.zip[:5])
-    zip4_escaped = xml_escape(address.zip[5:] if len(address.zip) > 5 else "")
-    user_id_escaped = xml_escape(user_id)
-
-    xml_parts = [
-        f'<AddressValidateRequest USERID="{user_id_escaped}">',
-        '  <Revision>1</Revision>',
-        '  <Address ID="0">',
-        f'    <Address1>{street2_escaped}</Address1>',
-        f'    <Address2>{street1_escaped}</Address2>',
-        f'    <City>{city_escaped}</City>',
-        f'    <State>{state_escaped}</State>',
-        f'    <Zip5>{zip5_escaped}</Zip5>',
-        f'    <Zip4>{zip4_escaped}</Zip4>',
-        '  </Address>',
-        '</AddressValidateRequest>'
-    ]
-    return ''.join(xml_parts)
+    address_xml = "".join(
+        USPS_ADDRESS_TEMPLATE % {
+            "id": address_id,
+            "street1": xml_escape(address.street1),
+            "street2": xml_escape(address.street2 or ""),
+            "city": xml_escape(address.city),
+            "state": xml_escape(address.state.upper()),
+            "zip5": address.zip5,
+            "zip4": address.zip4,
+        }
+        for address_id, address in enumerate(addresses)
+    )
+    return USPS_REQUEST_TEMPLATE % {
+        "user_id": xml_escape(user_id),
+        "addresses": address_xml,
+    }
+
+
+def _usps_error_message(error: Element) -> str:
+    """Format a USPS <Error> element as a message"""
+    error_number = error.find('Number')
+    error_desc = error.find('Description')
+    error_msg = f"USPS Error {error_number.text if error_number is not None else 'Unknown'}: "
+    error_msg += error_desc.text if error_desc is not None else "Unknown error"
+    return error_msg
 
 
-def parse_usps_response(xml_string: str) -> dict:
+def parse_usps_response(xml_string: str) -> Dict[int, Element]:
     """
     Parse USPS XML response
 
@@ -79,71 +200,238 @@ def parse_usps_response(xml_string: str) -> dict:
         xml_string: XML response from USPS API
 
     Returns:
-        Parsed response dictionary
+        Response <Address> elements keyed by Address ID
 
     Raises:
-        ValueError: If response contains error
+        ValueError: If the response is invalid or the whole request failed
     """
     try:
         root = ET.fromstring(xml_string)
+    except ET.ParseError as e:
+        logger.error(f"XML parse error: {e}")
+        raise ValueError(f"Invalid XML response from USPS: {str(e)}")
 
-        # Check for error response
-        error = root.find('.//Error')
-        if error is not None:
-            error_number = error.find('Number')
-            error_desc = error.find('Description')
-            error_msg = f"USPS Error {error_number.text if error_number is not None else 'Unknown'}: "
-            error_msg += error_desc.text if error_desc is not None else "Unknown error"
-            raise ValueError(error_msg)
-
-        # Parse successful response
-        address_elem = root.find('.//Address')
-        if address_elem is None:
-            raise ValueError("No address found in USPS response")
-
-        # Extract address components
-        result = {}
-        for field in ['Address1', 'Address2', 'City', 'State', 'Zip5', 'Zip4']:
-            elem = address_elem.find(field)
-            if elem is not None and elem.text:
-                result[field.lower()] = elem.text
-
-        # Standardize field names
-        standardized = {
-            'street1': result.get('address2', ''),
-            'street2': result.get('address1', ''),
-            'city': result.get('city', ''),
-            'state': result.get('state', ''),
-            'zip': result.get('zip5', ''),
-            'zip4': result.get('zip4', '')
-        }
+    # Request-level errors (e.g. bad USERID) come back as a root <Error>
+    error = root if root.tag == 'Error' else root.find('Error')
+    if error is not None:
+        raise ValueError(_usps_error_message(error))
 
-        # Combine ZIP+4 if available
-        if standardized['zip4']:
-            standardized['zip'] = f"{standardized['zip']}-{standardized['zip4']}"
+    # <Address> elements are direct children of AddressValidateResponse
+    addresses = {}
+    for address_elem in root.iterfind('Address'):
+        try:
+            addresses[int(address_elem.get('ID', '0'))] = address_elem
+        except ValueError:
+            logger.warning(f"Ignoring USPS address with invalid ID: {address_elem.get('ID')}")
+    return addresses
 
-        return standardized
 
-    except ET.ParseError as e:
-        logger.error(f"XML parse error: {e}")
-        raise ValueError(f"Invalid XML response from USPS: {str(e)}")
+def standardize_address(address_elem: Element) -> dict:
+    """
+    Extract the standardized address from a USPS response <Address>
 
+    Args:
+        address_elem: <Address> element from parse_usps_response
 
-@router.post("/validate", response_model=AddressValidationResponse)
-async def validate_address(address: AddressRequest) -> AddressValidationResponse:
+    Returns:
+        Standardized address dictionary
+
+    Raises:
+        ValueError: If USPS returned an error for this address
     """
-    Validate and standardize a US address using USPS Web Tools API
+    # Index the children once; per-address errors are a direct <Error> child
+    children = {child.tag: child for child in address_elem}
+
+    error = children.get('Error')
+    if error is not None:
+        raise ValueError(_usps_error_message(error))
+
+    # Extract address components
+    result = {}
+    for tag, key in USPS_ADDRESS_FIELDS:
+        elem = children.get(tag)
+        if elem is not None and elem.text:
+            result[key] = elem.text
+
+    # Standardize field names
+    standardized = {
+        'street1': result.get('address2', ''),
+        'street2': result.get('address1', ''),
+        'city': result.get('city', ''),
+        'state': result.get('state', ''),
+        'zip': result.get('zip5', ''),
+        'zip4': result.get('zip4', '')
+    }
+
+    # Combine ZIP+4 if available
+    if standardized['zip4']:
+        standardized['zip'] = f"{standardized['zip']}-{standardized['zip4']}"
+
+    return standardized
+
+
+async def call_usps_api(xml_request: str) -> str:
+    """
+    Send an AddressValidateRequest to the USPS Web Tools API
+
+    Uses the shared pooled client, so the TLS connection to USPS is reused
+    across requests. Small requests go in the query string; larger ones are
+    POSTed as a form body to keep URLs short.
 
     Args:
-        address: Address to validate
+        xml_request: AddressValidateRequest XML
 
     Returns:
-        AddressValidationResponse with standardized address or error
+        USPS response XML
 
     Raises:
-        HTTPException: If USPS API is unavailable or configuration is missing
+        httpx.HTTPError: If the request fails
+        ValueError: If the response exceeds USPS_MAX_RESPONSE_BYTES
+    """
+    client = get_http_client("usps", timeout=USPS_TIMEOUT, limits=USPS_LIMITS)
+    params = {
+        "API": "Verify",
+        "XML": xml_request
+    }
+
+    if len(xml_request) > USPS_MAX_GET_XML:
+        request = client.build_request("POST", USPS_API_URL, data=params)
+    else:
+        request = client.build_request("GET", USPS_API_URL, params=params)
+
+    # Stream the body so an oversized response is cut off instead of buffered
+    response = await client.send(request, stream=True)
+    try:
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > USPS_MAX_RESPONSE_BYTES:
+                raise ValueError("USPS response exceeds size limit")
+        return body.decode(response.encoding or "utf-8")
+    finally:
+        await response.aclose()
+
+
+class USPSRequestCoalescer:
+    """
+    Coalesce concurrent single-address validations into batched USPS calls
+
+    The first address queued opens a short window; addresses arriving
+    within it are sent together (up to USPS_MAX_BATCH per call) and each
+    caller receives its own <Address> element from the shared response.
+    """
+
+    def __init__(self, max_batch: int = USPS_MAX_BATCH, window: float = USPS_BATCH_WINDOW) -> None:
+        self.max_batch = max_batch
+        self.window = window
+        self._pending: Dict[str, List[Tuple[AddressRequest, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def validate(self, address: AddressRequest, user_id: str) -> Element:
+        """
+        Queue an address for the next batch and wait for its result
+
+        Raises:
+            ValueError: If the response is invalid or has no result for the address
+            httpx.HTTPError: If the USPS request fails
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(user_id, [])
+        pending.append((address, future))
+
+        if len(pending) >= self.max_batch:
+            self._flush(user_id)
+        elif user_id not in self._timers:
+            self._timers[user_id] = loop.call_later(self.window, self._flush, user_id)
+
+        return await future
+
+    def _flush(self, user_id: str) -> None:
+        timer = self._timers.pop(user_id, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(user_id, [])
+        if batch:
+            # Keep a reference so the task isn't garbage collected mid-flight
+            task = asyncio.ensure_future(self._send(batch, user_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[AddressRequest, asyncio.Future]], user_id: str) -> None:
+        try:
+            xml_request = build_usps_xml([address for address, _ in batch], user_id)
+            addresses = parse_usps_response(await call_usps_api(xml_request))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for address_id, (_, future) in enumerate(batch):
+            if future.done():
+                # Caller went away (e.g. client disconnected)
+                continue
+            address_elem = addresses.get(address_id)
+            if address_elem is None:
+                future.set_exception(ValueError("No address found in USPS response"))
+            else:
+                future.set_result(address_elem)
+
+
+_coalescer = USPSRequestCoalescer()
+
+# Successful standardizations keyed by address_cache_key; errors are never cached
+_address_cache: TTLCache = TTLCache(maxsize=ADDRESS_CACHE_SIZE, ttl=ADDRESS_CACHE_TTL)
+
+
+def address_cache_key(address: AddressRequest) -> Tuple[str, str, str, str, str]:
+    """
+    Build a canonical cache key for an address
+
+    Fields are uppercased with whitespace collapsed, and only the 5-digit
+    ZIP is used, so trivially different spellings share a cache entry.
+    """
+    def normalize(value: Optional[str]) -> str:
+        return " ".join((value or "").upper().split())
+
+    return (
+        normalize(address.street1),
+        normalize(address.street2),
+        normalize(address.city),
+        normalize(address.state),
+        address.zip5,
+    )
+
+
+def get_cached_validation(address: AddressRequest) -> Optional[AddressValidationResponse]:
+    """Get a successful validation result from the cache, if present"""
+    standardized = _address_cache.get(address_cache_key(address))
+    if standardized is None:
+        return None
+    return AddressValidationResponse(
+        success=True,
+        standardized_address=standardized,
+        error=None,
+        raw_response=None
+    )
+
+
+def cache_validation(address: AddressRequest, result: AddressValidationResponse) -> None:
+    """Cache a validation result if USPS standardized the address"""
+    if result.success and result.standardized_address is not None:
+        _address_cache[address_cache_key(address)] = result.standardized_address
+
+
+def get_usps_user_id() -> str:
+    """
+    Get the configured USPS API user ID
+
+    Raises:
+        HTTPException: If USPS_API_USER_ID is not set
     """
-    # Check for USPS API user ID
     usps_user_id = os.getenv("USPS_API_USER_ID")
     if not usps_user_id:
         logger.error("USPS_API_USER_ID environment variable not set")
@@ -151,34 +439,21 @@ async def validate_address(address: AddressRequest) -> AddressValidationResponse
             status_code=500,
             detail="USPS API is not configured. Please set USPS_API_USER_ID environment variable."
         )
+    return usps_user_id
 
-    try:
-        # Build XML request
-        xml_request = build_usps_xml(address, usps_user_id)
-
-        # Call USPS API
-        usps_url = "https://secure.shippingapis.com/ShippingAPI.dll"
-        params = {
-            "API": "Verify",
-            "XML": xml_request
-        }
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(usps_url, params=params)
-            response.raise_for_status()
-
-            # Parse response
-            standardized = parse_usps_response(response.text)
 
-            logger.info(f"Successfully validated address: {address.city}, {address.state}")
+def build_validation_response(address_elem: Element) -> AddressValidationResponse:
+    """
+    Build the validation result for one USPS response <Address>
 
-            return AddressValidationResponse(
-                success=True,
-                standardized_address=standardized,
-                error=None,
-                raw_response={"xml": response.text} if os.getenv("PYTHON_ENV") == "development" else None
-            )
+    Args:
+        address_elem: <Address> element from parse_usps_response
 
+    Returns:
+        AddressValidationResponse with standardized address or error
+    """
+    try:
+        standardized = standardize_address(address_elem)
     except ValueError as e:
         # USPS validation error (address not found, invalid, etc.)
         logger.warning(f"USPS validation error: {str(e)}")
@@ -189,23 +464,142 @@ async def validate_address(address: AddressRequest) -> AddressValidationResponse
             raw_response=None
         )
 
-    except httpx.HTTPStatusError as e:
+    # Only this address's element, so coalesced requests never see each other's data
+    raw_response = None
+    if os.getenv("PYTHON_ENV") == "development":
+        raw_response = {"xml": ET.tostring(address_elem, encoding="unicode")}
+
+    return AddressValidationResponse(
+        success=True,
+        standardized_address=standardized,
+        error=None,
+        raw_response=raw_response
+    )
+
+
+def usps_http_exception(e: Exception) -> HTTPException:
+    """Map an unexpected USPS call failure to an HTTPException"""
+    if isinstance(e, httpx.HTTPStatusError):
         logger.error(f"USPS API HTTP error: {e.response.status_code}")
-        raise HTTPException(
+        return HTTPException(
             status_code=502,
             detail=f"USPS API returned error: {e.response.status_code}"
         )
 
-    except httpx.RequestError as e:
+    if isinstance(e, httpx.RequestError):
         logger.error(f"USPS API request error: {str(e)}")
-        raise HTTPException(
+        return HTTPException(
             status_code=503,
             detail="Unable to connect to USPS API. Please try again later."
         )
 
+    logger.error(f"Unexpected error in USPS validation: {str(e)}", exc_info=True)
+    return HTTPException(
+        status_code=500,
+        detail="An unexpected error occurred during address validation."
+    )
+
+
+@router.post("/validate", response_model=AddressValidationResponse)
+async def validate_address(address: AddressRequest) -> AddressValidationResponse:
+    """
+    Validate and standardize a US address using USPS Web Tools API
+
+    Successful results are cached for ADDRESS_CACHE_TTL seconds. Concurrent
+    uncached calls are coalesced into shared USPS requests of up to
+    USPS_MAX_BATCH addresses.
+
+    Args:
+        address: Address to validate
+
+    Returns:
+        AddressValidationResponse with standardized address or error
+
+    Raises:
+        HTTPException: If USPS API is unavailable or configuration is missing
+    """
+    usps_user_id = get_usps_user_id()
+
+    cached = get_cached_validation(address)
+    if cached is not None:
+        return cached
+
+    try:
+        address_elem = await _coalescer.validate(address, usps_user_id)
+    except ValueError as e:
+        # Invalid response or request-level USPS error
+        logger.warning(f"USPS validation error: {str(e)}")
+        return AddressValidationResponse(
+            success=False,
+            standardized_address=None,
+            error=str(e),
+            raw_response=None
+        )
     except Exception as e:
-        logger.error(f"Unexpected error in USPS validation: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="An unexpected error occurred during address validation."
+        raise usps_http_exception(e)
+
+    result = build_validation_response(address_elem)
+    if result.success:
+        logger.info(f"Successfully validated address: {address.city}, {address.state}")
+        cache_validation(address, result)
+    return result
+
+
+@router.post("/validate/batch", response_model=AddressBatchValidationResponse)
+async def validate_addresses(batch: AddressBatchRequest) -> AddressBatchValidationResponse:
+    """
+    Validate up to USPS_MAX_BATCH addresses in a single USPS API call
+
+    Args:
+        batch: Addresses to validate
+
+    Returns:
+        AddressBatchValidationResponse with one result per address, in order
+
+    Raises:
+        HTTPException: If USPS API is unavailable or configuration is missing
+    """
+    usps_user_id = get_usps_user_id()
+
+    results: List[Optional[AddressValidationResponse]] = [
+        get_cached_validation(address) for address in batch.addresses
+    ]
+    # Indexes into batch.addresses that still need a USPS lookup
+    misses = [index for index, result in enumerate(results) if result is None]
+    if not misses:
+        return AddressBatchValidationResponse(results=results)
+
+    try:
+        xml_request = build_usps_xml([batch.addresses[index] for index in misses], usps_user_id)
+        addresses = parse_usps_response(await call_usps_api(xml_request))
+    except ValueError as e:
+        # Invalid response or request-level USPS error applies to every lookup
+        logger.warning(f"USPS validation error: {str(e)}")
+        failed = AddressValidationResponse(
+            success=False,
+            standardized_address=None,
+            error=str(e),
+            raw_response=None
         )
+        for index in misses:
+            results[index] = failed
+        return AddressBatchValidationResponse(results=results)
+    except Exception as e:
+        raise usps_http_exception(e)
+
+    for address_id, index in enumerate(misses):
+        address_elem = addresses.get(address_id)
+        if address_elem is None:
+            results[index] = AddressValidationResponse(
+                success=False,
+                standardized_address=None,
+                error="No address found in USPS response",
+                raw_response=None
+            )
+        else:
+            result = build_validation_response(address_elem)
+            cache_validation(batch.addresses[index], result)
+            results[index] = result
+
+    logger.info(f"Validated batch of {len(results)} addresses ({len(misses)} uncached)")
+    return AddressBatchValidationResponse(results=results)